@@ -38,9 +38,35 @@ class Config:
     jpeg_initial_quality: int = 95
     jpeg_min_quality: int = 10
     jpeg_quality_step: int = 5
+    # Progressive 4:2:0 JPEGs are smaller at the same quality setting, so the
+    # size limit is met at a higher quality (subsampling: 0 = 4:4:4,
+    # 1 = 4:2:2, 2 = 4:2:0)
+    jpeg_progressive: bool = True
+    jpeg_subsampling: int = 2
     png_compress_level: int = 9
+    # Dithering (0.0 to 1.0) when quantizing PNGs with libimagequant; it
+    # smooths gradients but the added noise compresses worse
+    png_dithering_level: float = 0.0
     min_scale_factor: float = 0.5
     scale_factor_step: float = 0.05
+    scale_search_iterations: int = 6
+    # Threads used to probe JPEG qualities in parallel (1 probes sequentially)
+    max_probe_workers: int = 4
+    # Drop EXIF, ICC profile and comments from the output (converting pixels
+    # to sRGB first); phone photos can carry enough metadata to matter at
+    # small file size limits
+    strip_metadata: bool = True
+    
+    # Resampling settings
+    # Downscales by more than this factor use BILINEAR instead of LANCZOS:
+    # 2 filter taps per unit instead of 6, several times faster at a slight
+    # loss of sharpness (0 always uses LANCZOS)
+    bilinear_downscale_factor: float = 3.0
+    
+    # Backend settings
+    # "pil", or "vips" to process JPEG output with libvips (requires pyvips,
+    # falls back to PIL when it is not installed)
+    backend: str = "pil"
     
     # Server settings
     server_name: str = "127.0.0.1"
@@ -3,10 +3,64 @@ Image processing module for Pixellate.
 """
 
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 import io
-from typing import Tuple
+import math
+import os
+import threading
+from typing import Callable, Optional, Tuple
 from pixellate.config import DEFAULT_CONFIG
 
+try:
+    import pyvips
+except (ImportError, OSError):
+    # pyvips is optional; OSError covers a missing libvips shared library
+    pyvips = None
+
+try:
+    import imagequant
+except ImportError:
+    imagequant = None
+
+try:
+    from PIL import ImageCms
+except ImportError:
+    # Pillow built without littlecms
+    ImageCms = None
+
+
+# Encode buffers are pre-sized to the file size limit or this many bytes per
+# pixel, whichever is smaller, plus headroom so probes that overshoot rarely
+# need to grow the buffer
+_BUFFER_BYTES_PER_PIXEL = 2
+_BUFFER_HEADROOM = 64 * 1024
+
+# Upper bound on JPEG bytes per pixel at quality 95 with 4:2:0 subsampling;
+# images that fit the file size limit even at this rate skip the quality search
+_JPEG_MAX_BYTES_PER_PIXEL = 1.5
+
+# EXIF orientation tag, and the transpose that displays each orientation
+# upright (as in ImageOps.exif_transpose)
+_EXIF_ORIENTATION = 0x0112
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+# Orientations that swap width and height
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+# image.info entries that end up in saved JPEG/PNG files
+_METADATA_KEYS = ('exif', 'icc_profile', 'comment')
+
+# Modes that can be converted to sRGB before dropping their ICC profile,
+# and the mode of the converted image
+_SRGB_MODES = {'RGB': 'RGB', 'RGBA': 'RGBA', 'CMYK': 'RGB'}
+
 
 class ImageProcessor:
     """Handles image processing operations."""
@@ -19,20 +73,72 @@ class ImageProcessor:
             config: Configuration object (uses DEFAULT_CONFIG if None)
         """
         self.config = config or DEFAULT_CONFIG
+        
+        # Resolve compression settings once, they are read in every encode loop
+        self._jpeg_initial_quality = int(self.config.jpeg_initial_quality)
+        self._jpeg_min_quality = int(self.config.jpeg_min_quality)
+        self._jpeg_quality_step = int(self.config.jpeg_quality_step)
+        self._png_compress_level = int(self.config.png_compress_level)
+        self._png_dithering_level = float(self.config.png_dithering_level)
+        self._min_scale_factor = float(self.config.min_scale_factor)
+        self._scale_factor_step = float(self.config.scale_factor_step)
+        self._scale_search_iterations = int(self.config.scale_search_iterations)
+        self._bilinear_downscale_factor = float(self.config.bilinear_downscale_factor)
+        self._use_vips = self.config.backend == 'vips' and pyvips is not None
+        self._strip_metadata = bool(self.config.strip_metadata)
+        self._jpeg_progressive = bool(self.config.jpeg_progressive)
+        self._jpeg_subsampling = int(self.config.jpeg_subsampling)
+        self._jpeg_params = {
+            'format': 'JPEG',
+            'progressive': self._jpeg_progressive,
+            'subsampling': self._jpeg_subsampling,
+        }
+        
+        # Encoders release the GIL, so quality probes can run concurrently
+        self._probe_workers = max(1, min(int(self.config.max_probe_workers), os.cpu_count() or 1))
+        self._executor = (
+            ThreadPoolExecutor(max_workers=self._probe_workers, thread_name_prefix='pixellate-probe')
+            if self._probe_workers > 1 else None
+        )
+        # Per-thread image copy and encode buffer, kept across requests
+        self._probe_local = threading.local()
+        
+        # The quality ladder and first probe round depend only on the config,
+        # so build them here rather than on every request. The first round is
+        # the initial quality, since small targets usually fit there, plus
+        # evenly spaced rungs below it when probes can run in parallel. When
+        # the initial quality was already tried and overshot, the round is
+        # spread over the rungs below it instead
+        step = self._jpeg_quality_step
+        if step < 1:
+            raise ValueError("jpeg_quality_step must be at least 1")
+        if self._jpeg_min_quality > self._jpeg_initial_quality:
+            raise ValueError("jpeg_min_quality must not exceed jpeg_initial_quality")
+        last_rung = (self._jpeg_initial_quality - self._jpeg_min_quality) // step
+        self._quality_ladder = [
+            self._jpeg_initial_quality - rung * step for rung in range(last_rung + 1)
+        ]
+        workers = self._probe_workers if self._executor is not None else 1
+        self._probe_rungs = sorted({round(i * last_rung / workers) for i in range(workers)})
+        self._probe_qualities = [self._quality_ladder[rung] for rung in self._probe_rungs]
+        self._lower_probe_rungs = sorted(
+            {1 + round(i * (last_rung - 1) / workers) for i in range(workers)}
+        ) if last_rung else []
+        self._lower_probe_qualities = [self._quality_ladder[rung] for rung in self._lower_probe_rungs]
     
-    def crop_to_ratio(self, image: Image.Image, crop_size_pixels: int) -> Image.Image:
+    def crop_box(self, size: Tuple[int, int], crop_size_pixels: int) -> Tuple[int, int, int, int]:
         """
-        Crop image maintaining the original aspect ratio.
+        Compute the centered crop box maintaining the original aspect ratio.
         The crop_size_pixels represents the size of the smaller dimension.
         
         Args:
-            image: Input PIL Image
+            size: Image size as (width, height)
             crop_size_pixels: Size of the smaller dimension in pixels
             
         Returns:
-            Cropped image maintaining original aspect ratio
+            Crop box as (left, top, right, bottom)
         """
-        width, height = image.size
+        width, height = size
         aspect_ratio = width / height
         
         # Calculate crop dimensions maintaining aspect ratio
@@ -55,10 +161,289 @@ class ImageProcessor:
         right = left + crop_width
         bottom = top + crop_height
         
-        # Crop maintaining aspect ratio
-        cropped = image.crop((left, top, right, bottom))
+        return left, top, right, bottom
+    
+    def crop_to_ratio(self, image: Image.Image, crop_size_pixels: int) -> Image.Image:
+        """
+        Crop image maintaining the original aspect ratio.
+        The crop_size_pixels represents the size of the smaller dimension.
+        
+        Args:
+            image: Input PIL Image
+            crop_size_pixels: Size of the smaller dimension in pixels
+            
+        Returns:
+            Cropped image maintaining original aspect ratio
+        """
+        return image.crop(self.crop_box(image.size, crop_size_pixels))
+    
+    def check_target_size(self, target_width: int, target_height: int) -> None:
+        """
+        Reject target resolutions that can't be resized to.
+        
+        Args:
+            target_width: Target width in pixels
+            target_height: Target height in pixels
+            
+        Raises:
+            ValueError: If either dimension is not positive
+        """
+        if target_width <= 0 or target_height <= 0:
+            # Same message Image.resize gives
+            raise ValueError("height and width must be > 0")
+    
+    def resample_filter(
+        self,
+        box: Tuple[float, float, float, float],
+        target_width: int,
+        target_height: int
+    ) -> Image.Resampling:
+        """
+        Choose the resampling filter for resizing box to the target resolution.
         
-        return cropped
+        Args:
+            box: Source region as (left, top, right, bottom)
+            target_width: Target width
+            target_height: Target height
+            
+        Returns:
+            BILINEAR for large downscales, LANCZOS otherwise
+        """
+        left, top, right, bottom = box
+        downscale = min((right - left) / target_width, (bottom - top) / target_height)
+        if 0 < self._bilinear_downscale_factor < downscale:
+            return Image.Resampling.BILINEAR
+        return Image.Resampling.LANCZOS
+    
+    def draft_for_crop(
+        self,
+        image: Image.Image,
+        box: Tuple[float, float, float, float],
+        target_width: int,
+        target_height: int
+    ) -> Tuple[float, float, float, float]:
+        """
+        Let libjpeg decode a JPEG at reduced scale when the crop will be
+        downsized anyway. Only effective before the image pixels are loaded.
+        
+        The image is decoded at the smallest 1/2, 1/4 or 1/8 scale that still
+        leaves the crop region at least twice the target resolution.
+        
+        Args:
+            image: Input PIL Image (modified in place)
+            box: Crop box in coordinates of the undecoded image
+            target_width: Target width
+            target_height: Target height
+            
+        Returns:
+            Crop box scaled to the drafted image
+        """
+        if getattr(image, 'format', None) != 'JPEG' or not hasattr(image, 'draft'):
+            return box
+        
+        left, top, right, bottom = box
+        width, height = image.size
+        budget = 2 * max(target_width, target_height)
+        crop_pixels = min(right - left, bottom - top)
+        if crop_pixels <= budget:
+            return box
+        
+        scale = budget / crop_pixels
+        image.draft('RGB', (math.ceil(width * scale), math.ceil(height * scale)))
+        
+        # Re-read the size, libjpeg only scales by powers of two. resize()
+        # accepts fractional boxes, so the scaled box keeps the exact region
+        scale_x = image.size[0] / width
+        scale_y = image.size[1] / height
+        return left * scale_x, top * scale_y, right * scale_x, bottom * scale_y
+    
+    def strip_metadata(self, image: Image.Image) -> Image.Image:
+        """
+        Remove metadata that Pillow would carry over from image.info into
+        saved files (EXIF, ICC profile, JPEG comment).
+        
+        Images with an ICC profile are converted to sRGB first, so dropping
+        the profile doesn't shift their colors. If the conversion isn't
+        possible, the profile is kept.
+        
+        Args:
+            image: PIL Image (modified in place unless converted)
+            
+        Returns:
+            PIL Image without metadata
+        """
+        icc_profile = image.info.get('icc_profile')
+        if icc_profile:
+            converted = self.to_srgb(image, icc_profile)
+            if converted is None:
+                icc_profile = image.info.pop('icc_profile')
+            else:
+                image, icc_profile = converted, None
+        
+        for key in _METADATA_KEYS:
+            image.info.pop(key, None)
+        if icc_profile:
+            image.info['icc_profile'] = icc_profile
+        return image
+    
+    def to_srgb(self, image: Image.Image, icc_profile: bytes) -> Optional[Image.Image]:
+        """
+        Convert image pixels from their ICC profile to sRGB.
+        
+        Args:
+            image: PIL Image
+            icc_profile: ICC profile the pixels are encoded in
+            
+        Returns:
+            Converted PIL Image, or None if the conversion isn't possible
+        """
+        if ImageCms is None or image.mode not in _SRGB_MODES:
+            return None
+        
+        try:
+            return ImageCms.profileToProfile(
+                image,
+                ImageCms.ImageCmsProfile(io.BytesIO(icc_profile)),
+                ImageCms.createProfile('sRGB'),
+                outputMode=_SRGB_MODES[image.mode]
+            )
+        except (ImageCms.PyCMSError, OSError, ValueError):
+            return None
+    
+    def quantize(self, image: Image.Image) -> Image.Image:
+        """
+        Convert image to a 256-color palette.
+        
+        Uses libimagequant when the imagequant package is installed, which
+        gives better palettes than Pillow's median cut quantizer.
+        
+        Args:
+            image: PIL Image to quantize
+            
+        Returns:
+            Palette ('P' mode) image
+        """
+        if imagequant is not None:
+            return imagequant.quantize_pil_image(
+                image, dithering_level=self._png_dithering_level, max_colors=256
+            )
+        return image.convert('P', palette=Image.Palette.ADAPTIVE)
+    
+    def _new_buffer(self, max_file_size_bytes: int, pixel_count: int) -> io.BytesIO:
+        """Create an encode buffer pre-sized for the image and size limit."""
+        size = min(max_file_size_bytes, pixel_count * _BUFFER_BYTES_PER_PIXEL)
+        return io.BytesIO(bytes(size + _BUFFER_HEADROOM))
+    
+    @staticmethod
+    def _encode(image: Image.Image, buffer: io.BytesIO, **params) -> int:
+        """
+        Encode image at the start of buffer and return the encoded size.
+        
+        The buffer is overwritten rather than truncated so its allocation is
+        reused across attempts; bytes past the returned size are stale.
+        """
+        buffer.seek(0)
+        image.save(buffer, **params)
+        return buffer.tell()
+    
+    @staticmethod
+    def _encoded_bytes(buffer: io.BytesIO, size: int) -> bytes:
+        """Copy the first size bytes of buffer."""
+        with buffer.getbuffer() as view:
+            return view[:size].tobytes()
+    
+    def _search_quality(
+        self,
+        encode: Callable[[int, bool], Optional[bytes]],
+        pixel_count: int,
+        max_file_size_bytes: int
+    ) -> Optional[Tuple[int, bytes]]:
+        """
+        Search the JPEG quality ladder (initial, initial - step, ..., min)
+        for the highest quality whose encode fits. The initial quality is
+        tried first, together with evenly spaced lower qualities on the probe
+        thread pool if enabled, then the remaining bracket is binary searched.
+        
+        Probes skip entropy-coding optimization. Progressive JPEGs are
+        always optimized, so their probe bytes are final; for baseline JPEGs
+        the higher qualities are rechecked optimized, since optimization can
+        bring a rejected probe under the limit. When the image is too small
+        to possibly exceed the limit, the search is skipped and a single
+        optimized encode runs.
+        
+        Args:
+            encode: Encodes at the given quality, optimized or not, and
+                returns the bytes, or None if they exceed the file size limit.
+                Must be thread-safe when the probe thread pool is enabled
+            pixel_count: Number of pixels in the encoded image
+            max_file_size_bytes: Maximum file size in bytes
+            
+        Returns:
+            Tuple of (quality, encoded_bytes), or None if no quality fits
+        """
+        ladder = self._quality_ladder
+        
+        first = 0
+        rungs, qualities = self._probe_rungs, self._probe_qualities
+        if pixel_count * _JPEG_MAX_BYTES_PER_PIXEL < max_file_size_bytes:
+            data = encode(ladder[0], True)
+            if data is not None:
+                return ladder[0], data
+            
+            # An unoptimized probe can only be larger, so skip the first rung
+            first = 1
+            rungs, qualities = self._lower_probe_rungs, self._lower_probe_qualities
+            if not rungs:
+                return None
+        
+        if len(rungs) > 1:
+            results = list(self._executor.map(encode, qualities, [False] * len(qualities)))
+        else:
+            results = [encode(qualities[0], False)]
+        
+        # Bisect the rungs between the last failing and first fitting probe
+        best = None
+        lo, hi = rungs[len(results) - 1] + 1, len(ladder) - 1
+        for i, data in enumerate(results):
+            if data is not None:
+                best = (rungs[i], data)
+                lo, hi = (rungs[i - 1] + 1 if i else first), rungs[i] - 1
+                break
+        
+        while lo <= hi:
+            rung = (lo + hi) // 2
+            data = encode(ladder[rung], False)
+            
+            if data is not None:
+                best = (rung, data)
+                hi = rung - 1
+            else:
+                lo = rung + 1
+        
+        # Progressive JPEGs always get optimal Huffman tables, so the probe
+        # bytes are already final
+        if self._jpeg_progressive:
+            return (ladder[best[0]], best[1]) if best is not None else None
+        
+        # Unoptimized baseline probes overstate the final size, so step up
+        # while the next higher quality fits once optimized
+        rung = best[0] if best is not None else len(ladder)
+        optimized = False
+        while rung > first:
+            data = encode(ladder[rung - 1], True)
+            if data is None:
+                break
+            rung -= 1
+            best = (rung, data)
+            optimized = True
+        
+        if best is None:
+            return None
+        
+        rung, data = best
+        if not optimized:
+            data = encode(ladder[rung], True) or data
+        return ladder[rung], data
     
     def compress_jpeg(
         self, 
@@ -66,7 +451,7 @@ class ImageProcessor:
         max_file_size_bytes: int,
         target_width: int,
         target_height: int
-    ) -> Tuple[Image.Image, str]:
+    ) -> Tuple[Image.Image, bytes, str]:
         """
         Compress JPEG image to meet file size requirement.
         
@@ -77,53 +462,110 @@ class ImageProcessor:
             target_height: Target height
             
         Returns:
-            Tuple of (compressed_image, info_message)
+            Tuple of (image, encoded_bytes, info_message), where
+            encoded_bytes is the accepted JPEG encode of image
         """
-        quality = self.config.jpeg_initial_quality
         processed = image
+        pixel_count = processed.width * processed.height
+        buffer = self._new_buffer(max_file_size_bytes, pixel_count)
         
-        # Try different quality levels
-        while quality > self.config.jpeg_min_quality:
-            buffer = io.BytesIO()
-            processed.save(buffer, format='JPEG', quality=quality, optimize=True)
-            file_size = buffer.tell()
+        caller = threading.get_ident()
+        local = self._probe_local
+        
+        def encode(quality: int, optimize: bool) -> Optional[bytes]:
+            if threading.get_ident() == caller:
+                source, target = processed, buffer
+            else:
+                # Image.save stores its parameters on the image, so probe
+                # threads encode their own copy into their own buffer. The
+                # buffer is reused by later requests, growing as needed
+                if getattr(local, 'source', None) is not processed:
+                    local.source, local.image = processed, processed.copy()
+                if not hasattr(local, 'buffer'):
+                    local.buffer = self._new_buffer(max_file_size_bytes, pixel_count)
+                source, target = local.image, local.buffer
             
+            file_size = self._encode(
+                source, target, quality=quality, optimize=optimize,
+                **self._jpeg_params
+            )
             if file_size <= max_file_size_bytes:
-                buffer.seek(0)
-                processed = Image.open(buffer)
-                processed.load()
-                info = f"Processed successfully! Final size: {file_size / 1024:.2f} KB, Quality: {quality}"
-                return processed, info
+                return self._encoded_bytes(target, file_size)
+            return None
+        
+        best = self._search_quality(encode, pixel_count, max_file_size_bytes)
+        if best is not None:
+            quality, data = best
+            info = f"Processed successfully! Final size: {len(data) / 1024:.2f} KB, Quality: {quality}"
+            return processed, data, info
+        
+        return self._downscale_jpeg(
+            processed, buffer, max_file_size_bytes, target_width, target_height
+        )
+    
+    def _downscale_jpeg(
+        self,
+        image: Image.Image,
+        buffer: io.BytesIO,
+        max_file_size_bytes: int,
+        target_width: int,
+        target_height: int
+    ) -> Tuple[Image.Image, bytes, str]:
+        """
+        Downscale a JPEG that does not fit at any quality on the ladder.
+        
+        Args:
+            image: PIL Image to compress
+            buffer: Reusable encode buffer
+            max_file_size_bytes: Maximum file size in bytes
+            target_width: Target width
+            target_height: Target height
             
-            quality -= self.config.jpeg_quality_step
+        Returns:
+            Tuple of (image, encoded_bytes, info_message)
+        """
+        processed = image
+        step = self._jpeg_quality_step
         
-        # If still too large, resize more aggressively
-        scale_factor = 0.9
-        while quality > self.config.jpeg_min_quality:
-            new_width = int(target_width * scale_factor)
-            new_height = int(target_height * scale_factor)
+        # If still too large, binary search for the largest scale that fits
+        # at a fixed low quality, always resizing from the full-size image.
+        # Optimization changes the size of baseline JPEGs only, so probes
+        # optimize exactly when it matters and need no final re-encode
+        quality = min(self._jpeg_min_quality + step, self._jpeg_initial_quality)
+        optimize = not self._jpeg_progressive
+        lo, hi = self._min_scale_factor, 1.0
+        best = None
+        for _ in range(self._scale_search_iterations):
+            scale_factor = (lo + hi) / 2
+            new_width = max(1, int(target_width * scale_factor))
+            new_height = max(1, int(target_height * scale_factor))
             temp_img = processed.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            buffer = io.BytesIO()
-            temp_img.save(buffer, format='JPEG', quality=quality, optimize=True)
-            file_size = buffer.tell()
+            file_size = self._encode(
+                temp_img, buffer, quality=quality, optimize=optimize,
+                **self._jpeg_params
+            )
             
             if file_size <= max_file_size_bytes:
-                buffer.seek(0)
-                processed = Image.open(buffer)
-                processed.load()
-                info = f"Processed with reduced size ({new_width}x{new_height})! Final size: {file_size / 1024:.2f} KB, Quality: {quality}"
-                return processed, info
-            
-            scale_factor -= self.config.scale_factor_step
-            if scale_factor < self.config.min_scale_factor:
-                quality -= self.config.jpeg_quality_step
+                best = (temp_img, self._encoded_bytes(buffer, file_size))
+                lo = scale_factor
+            else:
+                hi = scale_factor
+        
+        if best is not None:
+            temp_img, data = best
+            file_size = len(data)
+            new_width, new_height = temp_img.size
+            info = f"Processed with reduced size ({new_width}x{new_height})! Final size: {file_size / 1024:.2f} KB, Quality: {quality}"
+            return temp_img, data, info
         
         # Final fallback
-        buffer = io.BytesIO()
-        processed.save(buffer, format='JPEG', quality=quality, optimize=True)
-        file_size = buffer.tell()
+        quality = self._jpeg_min_quality
+        file_size = self._encode(
+            processed, buffer, quality=quality, optimize=True,
+            **self._jpeg_params
+        )
         info = f"Warning: Could not compress below target size. Final size: {file_size / 1024:.2f} KB"
-        return processed, info
+        return processed, self._encoded_bytes(buffer, file_size), info
     
     def compress_png(
         self, 
@@ -131,7 +573,7 @@ class ImageProcessor:
         max_file_size_bytes: int,
         target_width: int,
         target_height: int
-    ) -> Tuple[Image.Image, str]:
+    ) -> Tuple[Image.Image, bytes, str]:
         """
         Compress PNG image to meet file size requirement.
         
@@ -142,46 +584,53 @@ class ImageProcessor:
             target_height: Target height
             
         Returns:
-            Tuple of (compressed_image, info_message)
+            Tuple of (image, encoded_bytes, info_message), where
+            encoded_bytes is the accepted PNG encode of image
         """
         processed = image
-        compress_level = self.config.png_compress_level
+        compress_level = self._png_compress_level
         
-        buffer = io.BytesIO()
-        processed.save(buffer, format='PNG', compress_level=compress_level, optimize=True)
-        file_size = buffer.tell()
+        buffer = self._new_buffer(max_file_size_bytes, processed.width * processed.height)
+        file_size = self._encode(
+            processed, buffer, format='PNG', compress_level=compress_level, optimize=True
+        )
         
         if file_size <= max_file_size_bytes:
             info = f"Processed successfully! Final size: {file_size / 1024:.2f} KB"
-            return processed, info
+            return processed, self._encoded_bytes(buffer, file_size), info
         
         # Try converting to palette mode for smaller file size
         if processed.mode != 'P':
-            processed = processed.convert('P', palette=Image.Palette.ADAPTIVE)
-            buffer = io.BytesIO()
-            processed.save(buffer, format='PNG', compress_level=compress_level, optimize=True)
-            file_size = buffer.tell()
+            processed = self.quantize(processed)
+            file_size = self._encode(
+                processed, buffer, format='PNG', compress_level=compress_level, optimize=True
+            )
+        
+        # Keep the full-size encode for the fallback result
+        data = self._encoded_bytes(buffer, file_size)
+        
+        if file_size <= max_file_size_bytes:
+            info = f"Processed with reduced colors! Final size: {file_size / 1024:.2f} KB"
+            return processed, data, info
         
         # If still too large, reduce dimensions
-        if file_size > max_file_size_bytes:
-            scale_factor = 0.9
-            while file_size > max_file_size_bytes and scale_factor >= self.config.min_scale_factor:
-                new_width = int(target_width * scale_factor)
-                new_height = int(target_height * scale_factor)
-                temp_img = processed.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                buffer = io.BytesIO()
-                temp_img.save(buffer, format='PNG', compress_level=compress_level, optimize=True)
-                file_size = buffer.tell()
-                
-                if file_size <= max_file_size_bytes:
-                    processed = temp_img
-                    info = f"Processed with reduced size ({new_width}x{new_height})! Final size: {file_size / 1024:.2f} KB"
-                    return processed, info
-                
-                scale_factor -= self.config.scale_factor_step
+        scale_factor = 0.9
+        while file_size > max_file_size_bytes and scale_factor >= self._min_scale_factor:
+            new_width = int(target_width * scale_factor)
+            new_height = int(target_height * scale_factor)
+            temp_img = processed.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            file_size = self._encode(
+                temp_img, buffer, format='PNG', compress_level=compress_level, optimize=True
+            )
+            
+            if file_size <= max_file_size_bytes:
+                info = f"Processed with reduced size ({new_width}x{new_height})! Final size: {file_size / 1024:.2f} KB"
+                return temp_img, self._encoded_bytes(buffer, file_size), info
+            
+            scale_factor -= self._scale_factor_step
         
-        info = f"Warning: Could not compress below target size. Final size: {file_size / 1024:.2f} KB"
-        return processed, info
+        info = f"Warning: Could not compress below target size. Final size: {len(data) / 1024:.2f} KB"
+        return processed, data, info
     
     def process_image(
         self,
@@ -192,10 +641,13 @@ class ImageProcessor:
         max_file_size_mb: float,
         output_format: str,
         dpi: int
-    ) -> Tuple[Image.Image, str]:
+    ) -> Tuple[Image.Image, bytes, str]:
         """
         Process the image according to the specified parameters.
         
+        Pass a just-opened image whose pixels are not loaded yet (no copy()
+        or load()), so JPEG sources can be draft-decoded at reduced scale.
+        
         Args:
             image: Input PIL Image
             crop_size_inches: Size in inches for cropping (smaller dimension, maintains aspect ratio)
@@ -206,36 +658,200 @@ class ImageProcessor:
             dpi: DPI for inch-based calculations
         
         Returns:
-            Tuple of (processed_image, info_message)
+            Tuple of (processed_image, encoded_bytes, info_message), where
+            encoded_bytes is processed_image encoded in output_format
         """
         if image is None:
-            return None, "Please upload an image first."
+            return None, None, "Please upload an image first."
         
         try:
+            self.check_target_size(target_width, target_height)
+            
             # Step 1: Crop to specified inches (convert inches to pixels)
             # crop_size_inches represents the smaller dimension, maintaining aspect ratio
+            # The box is computed once on the source size and scaled if the
+            # JPEG is draft-decoded
             crop_size_pixels = int(crop_size_inches * dpi)
-            cropped = self.crop_to_ratio(image, crop_size_pixels)
+            box = self.crop_box(image.size, crop_size_pixels)
             
-            # Step 2: Resize to target resolution
-            processed = cropped.resize(
-                (target_width, target_height), 
-                Image.Resampling.LANCZOS
+            # EXIF orientation is applied after resizing, so work in the
+            # source orientation until then
+            orientation = image.getexif().get(_EXIF_ORIENTATION, 1)
+            if orientation in _TRANSPOSED_ORIENTATIONS:
+                size = (int(target_height), int(target_width))
+            else:
+                size = (int(target_width), int(target_height))
+            box = self.draft_for_crop(image, box, *size)
+            
+            # Step 2: Resize the crop box to target resolution in a single
+            # resample, without materializing the cropped image
+            processed = image.resize(
+                size, 
+                self.resample_filter(box, *size),
+                box=box
             )
+            if orientation in _ORIENTATION_TRANSPOSE:
+                processed = processed.transpose(_ORIENTATION_TRANSPOSE[orientation])
+            
+            # Step 3: Drop source metadata so it doesn't eat into the budget
+            if self._strip_metadata:
+                processed = self.strip_metadata(processed)
             
-            # Step 3: Compress to meet file size requirement
+            # Step 4: Compress to meet file size requirement
             max_file_size_bytes = int(max_file_size_mb * 1024 * 1024)
             
             if output_format.lower() in ['jpg', 'jpeg']:
-                processed, info = self.compress_jpeg(
+                processed, data, info = self.compress_jpeg(
                     processed, max_file_size_bytes, int(target_width), int(target_height)
                 )
             else:  # PNG
-                processed, info = self.compress_png(
+                processed, data, info = self.compress_png(
                     processed, max_file_size_bytes, int(target_width), int(target_height)
                 )
             
-            return processed, info
+            return processed, data, info
         
         except (ValueError, IOError, OSError) as e:
-            return None, f"Error processing image: {str(e)}"
+            return None, None, f"Error processing image: {str(e)}"
+    
+    def _process_vips(
+        self,
+        path: str,
+        crop_size_inches: float,
+        target_width: int,
+        target_height: int,
+        max_file_size_mb: float,
+        dpi: int
+    ) -> Tuple[Image.Image, bytes, str]:
+        """
+        Process an image file to JPEG with libvips.
+        
+        The source is streamed in sequential mode through crop and resize,
+        so only the target-size result is held in memory.
+        
+        Args:
+            path: Path to the input image
+            crop_size_inches: Size in inches for cropping (smaller dimension, maintains aspect ratio)
+            target_width: Target width in pixels
+            target_height: Target height in pixels
+            max_file_size_mb: Maximum file size in MB
+            dpi: DPI for inch-based calculations
+        
+        Returns:
+            Tuple of (processed_image, encoded_bytes, info_message)
+        """
+        source = pyvips.Image.new_from_file(path, access='sequential')
+        crop_size_pixels = int(crop_size_inches * dpi)
+        left, top, right, bottom = self.crop_box((source.width, source.height), crop_size_pixels)
+        crop_width, crop_height = right - left, bottom - top
+        
+        # Rotating needs random access, so crop and resize in the source
+        # orientation and apply EXIF orientation to the small result
+        orientation = source.get('orientation') if source.get_typeof('orientation') else 1
+        if orientation in _TRANSPOSED_ORIENTATIONS:
+            out_width, out_height = target_height, target_width
+        else:
+            out_width, out_height = target_width, target_height
+        
+        resized = source.crop(left, top, crop_width, crop_height).resize(
+            out_width / crop_width,
+            vscale=out_height / crop_height,
+            kernel='lanczos3'
+        )
+        if resized.hasalpha():
+            resized = resized.flatten(background=255)
+        # The profile is stripped on save, so convert tagged pixels to sRGB
+        if self._strip_metadata and resized.get_typeof('icc-profile-data'):
+            resized = resized.icc_transform('srgb', embedded=True)
+        # Materialize once, a sequential pipeline can only be read one time
+        resized = resized.colourspace('srgb').cast('uchar').copy_memory()
+        if orientation != 1:
+            resized = resized.autorot().copy_memory()
+        processed = Image.frombytes(
+            'RGB', (resized.width, resized.height), resized.write_to_memory()
+        )
+        
+        max_file_size_bytes = int(max_file_size_mb * 1024 * 1024)
+        
+        def encode(quality: int, optimize: bool) -> Optional[bytes]:
+            data = resized.jpegsave_buffer(
+                Q=quality,
+                optimize_coding=optimize,
+                strip=self._strip_metadata,
+                interlace=self._jpeg_progressive,
+                # libvips only chooses between 4:2:0 and 4:4:4
+                subsample_mode='off' if self._jpeg_subsampling == 0 else 'on'
+            )
+            return data if len(data) <= max_file_size_bytes else None
+        
+        best = self._search_quality(
+            encode, resized.width * resized.height, max_file_size_bytes
+        )
+        if best is None:
+            # No quality fits, so only the downscaling fallback is left
+            return self._downscale_jpeg(
+                processed,
+                self._new_buffer(max_file_size_bytes, processed.width * processed.height),
+                max_file_size_bytes, target_width, target_height
+            )
+        
+        quality, data = best
+        info = f"Processed successfully! Final size: {len(data) / 1024:.2f} KB, Quality: {quality}"
+        return processed, data, info
+    
+    def process_file(
+        self,
+        path: str,
+        crop_size_inches: float,
+        target_width: int,
+        target_height: int,
+        max_file_size_mb: float,
+        output_format: str,
+        dpi: int
+    ) -> Tuple[Image.Image, bytes, str]:
+        """
+        Process an image file according to the specified parameters.
+        
+        JPEG output uses the libvips backend when configured and pyvips is
+        installed; everything else goes through process_image.
+        
+        Args:
+            path: Path to the input image
+            crop_size_inches: Size in inches for cropping (smaller dimension, maintains aspect ratio)
+            target_width: Target width in pixels
+            target_height: Target height in pixels
+            max_file_size_mb: Maximum file size in MB
+            output_format: 'jpg' or 'png'
+            dpi: DPI for inch-based calculations
+        
+        Returns:
+            Tuple of (processed_image, encoded_bytes, info_message)
+        """
+        if path is None:
+            return None, None, "Please upload an image first."
+        
+        # Checked up front for both backends; libvips would clamp a zero
+        # size to one pixel instead of failing
+        try:
+            self.check_target_size(target_width, target_height)
+        except ValueError as e:
+            return None, None, f"Error processing image: {str(e)}"
+        
+        if self._use_vips and output_format.lower() in ['jpg', 'jpeg']:
+            try:
+                return self._process_vips(
+                    path, crop_size_inches, target_width, target_height,
+                    max_file_size_mb, dpi
+                )
+            except (pyvips.Error, ValueError, IOError, OSError) as e:
+                return None, None, f"Error processing image: {str(e)}"
+        
+        try:
+            # Open lazily so JPEGs can be draft-decoded
+            with Image.open(path) as image:
+                return self.process_image(
+                    image, crop_size_inches, target_width, target_height,
+                    max_file_size_mb, output_format, dpi
+                )
+        except (IOError, OSError) as e:
+            return None, None, f"Error processing image: {str(e)}"
@@ -1,5 +1,10 @@
 """
 Gradio UI module for Pixellate.
+
+Uploads are passed to the processor as file paths rather than decoded PIL
+images, so the processor controls how (and how much of) each photo is
+decoded, including applying its EXIF orientation. This relies on Gradio 5,
+which passes the uploaded file through untouched.
 """
 
 import gradio as gr
@@ -25,22 +30,23 @@ class PixellateUI:
         """
         self.config = config or DEFAULT_CONFIG
         self.processor = processor or ImageProcessor(self.config)
+        self._tmp = tempfile.gettempdir()
     
     def process_image(
         self,
-        img: Optional[Image.Image],
+        img: Optional[str],
         crop: float,
         w: float,
         h: float,
         max_size: float,
         fmt: str,
         dpi_val: float
-    ) -> Tuple[Optional[Image.Image], str, Optional[Image.Image]]:
+    ) -> Tuple[Optional[Image.Image], str, Optional[Tuple[Image.Image, bytes, str]]]:
         """
         Process image and return the processed image.
         
         Args:
-            img: Input image
+            img: Path to the uploaded image
             crop: Crop size in inches
             w: Target width
             h: Target height
@@ -49,46 +55,54 @@ class PixellateUI:
             dpi_val: DPI value
             
         Returns:
-            Tuple of (processed_image, info_message, processed_image_for_state)
+            Tuple of (processed_image, info_message, processed_state), where
+            processed_state is (processed_image, encoded_bytes, format)
         """
         if img is None:
             return None, "Please upload an image first.", None
         
-        processed_img, info = self.processor.process_image(
+        processed_img, encoded, info = self.processor.process_file(
             img, crop, int(w), int(h), max_size, fmt, int(dpi_val)
         )
         
         if processed_img is not None:
-            return processed_img, info, processed_img
+            file_ext = 'jpg' if fmt.lower() in ['jpg', 'jpeg'] else 'png'
+            return processed_img, info, (processed_img, encoded, file_ext)
         else:
             return None, info, None
     
     def export_to_format(
         self,
-        processed_img: Optional[Image.Image],
+        processed_state: Optional[Tuple[Image.Image, bytes, str]],
         format_type: str
     ):
         """
         Export processed image to specified format.
         
+        The bytes encoded during processing are written as-is when the
+        requested format matches; otherwise the image is re-encoded.
+        
         Args:
-            processed_img: Processed PIL Image
+            processed_state: Tuple of (processed_image, encoded_bytes, format)
             format_type: 'jpg' or 'png'
             
         Returns:
             File path string or None
         """
-        if processed_img is None:
+        if processed_state is None:
             return None
         
-        temp_dir = tempfile.gettempdir()
+        processed_img, encoded, encoded_ext = processed_state
+        
         # Use unique filename with timestamp to avoid conflicts
         timestamp = int(time.time() * 1000)
         file_ext = 'jpg' if format_type.lower() in ['jpg', 'jpeg'] else 'png'
-        temp_path = os.path.join(temp_dir, f"pixellate_export_{timestamp}.{file_ext}")
+        temp_path = os.path.join(self._tmp, f"pixellate_export_{timestamp}.{file_ext}")
         
         try:
-            if format_type.lower() in ['jpg', 'jpeg']:
+            if encoded and encoded_ext == file_ext:
+                self._write_bytes(temp_path, encoded)
+            elif file_ext == 'jpg':
                 processed_img.save(temp_path, format='JPEG', quality=95, optimize=True)
             else:  # PNG
                 processed_img.save(temp_path, format='PNG', optimize=True)
@@ -104,13 +118,44 @@ class PixellateUI:
             traceback.print_exc()
             return None
     
-    def export_to_jpg(self, processed_img: Optional[Image.Image]):
+    @staticmethod
+    def _write_bytes(path: str, data: bytes):
+        """
+        Write data to path with unbuffered OS-level writes.
+        
+        The file is sized to len(data) before writing (with preallocated
+        extents where posix_fallocate is available), then filled by offset.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(path, flags, 0o644)
+        try:
+            size = len(data)
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except (AttributeError, OSError):
+                # Not available on this platform or filesystem
+                os.ftruncate(fd, size)
+            
+            if hasattr(os, 'pwrite'):
+                write = os.pwrite
+            else:
+                # The file was just opened, so sequential writes start at 0
+                write = lambda fd, chunk, offset: os.write(fd, chunk)
+            
+            view = memoryview(data)
+            offset = 0
+            while offset < size:
+                offset += write(fd, view[offset:], offset)
+        finally:
+            os.close(fd)
+    
+    def export_to_jpg(self, processed_state: Optional[Tuple[Image.Image, bytes, str]]):
         """Export processed image to JPG format."""
-        return self.export_to_format(processed_img, 'jpg')
+        return self.export_to_format(processed_state, 'jpg')
     
-    def export_to_png(self, processed_img: Optional[Image.Image]):
+    def export_to_png(self, processed_state: Optional[Tuple[Image.Image, bytes, str]]):
         """Export processed image to PNG format."""
-        return self.export_to_format(processed_img, 'png')
+        return self.export_to_format(processed_state, 'png')
     
     def create_interface(self) -> gr.Blocks:
         """Create and return the Gradio interface."""
@@ -123,9 +168,15 @@ class PixellateUI:
                 with gr.Column(scale=1):
                     gr.Markdown("### Upload & Settings")
                     
+                    # Keep type="filepath": on Gradio 5 the upload arrives
+                    # undecoded, so ImageProcessor.process_file can draft-decode
+                    # JPEGs or stream them through libvips. Gradio then skips
+                    # EXIF orientation, which the processor applies instead.
+                    # (Gradio 4 decodes and re-encodes filepath uploads, hence
+                    # the gradio>=5 requirement.)
                     input_image = gr.Image(
                         label="Upload Photo",
-                        type="pil",
+                        type="filepath",
                         height=300
                     )
                     
@@ -190,7 +241,7 @@ class PixellateUI:
                         lines=3
                     )
                     
-                    # Store processed image in state for export
+                    # Store processed image and its encoded bytes in state for export
                     processed_image_state = gr.State(value=None)
                     
                     with gr.Row():